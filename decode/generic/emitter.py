@@ -1,3 +1,4 @@
+import math
 import warnings
 from deprecated import deprecated
 from typing import Union, Optional
@@ -6,7 +7,56 @@ import numpy as np
 import torch
 from pathlib import Path
 
-from . import slicing as gutil, test_utils as tutil
+
+class _BufferColumn:
+    """
+    Attribute of an EmitterSet that is stored as column(s) of one of its contiguous storage buffers.
+    Reading returns a view into the buffer. Assignment replaces the buffer by a copy with the values written into
+    (or a scalar filled into) the column, so that views obtained before keep their values.
+    """
+
+    def __init__(self, buffer: str, col: Union[int, slice]):
+        self.buffer = buffer
+        self.col = col
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return getattr(obj, self.buffer)[:, self.col]
+
+    def __set__(self, obj, value: Union[torch.Tensor, float]):
+        self._check(getattr(obj, self.buffer), value)
+
+        buf = getattr(obj, self.buffer).clone()
+        buf[:, self.col] = value
+        setattr(obj, self.buffer, buf)
+
+    def write(self, obj, value: Union[torch.Tensor, float]):
+        """
+        Writes the values into the current buffer in place. Only meant for buffers that were just allocated.
+        """
+        self._check(getattr(obj, self.buffer), value)
+        getattr(obj, self.buffer)[:, self.col] = value
+
+    def _check(self, buf: torch.Tensor, value: Union[torch.Tensor, float]):
+
+        if not buf.is_floating_point() and (isinstance(value, float) or
+                                            (isinstance(value, torch.Tensor) and value.is_floating_point())):
+            raise ValueError(f"Attribute must be integer type and not {getattr(value, 'dtype', type(value))}.")
+
+        if isinstance(value, torch.Tensor) and value.dim() >= 1:
+            if value.size(0) != buf.size(0):
+                raise ValueError(f"Expected {buf.size(0)} elements in 0th dimension but got {value.size(0)}.")
+
+            # no broadcasting of a single column into multiple ones (or vice versa)
+            if isinstance(self.col, int):
+                shape_expct = (buf.size(0),)
+            else:
+                shape_expct = (buf.size(0), len(range(*self.col.indices(buf.size(1)))))
+
+            if value.size() != shape_expct:
+                raise ValueError(f"Expected size {shape_expct} but got {tuple(value.size())}.")
 
 
 class EmitterSet:
@@ -27,10 +77,38 @@ class EmitterSet:
             xy_unit: Unit of the x and y coordinate.
             px_size: Pixel size for unit conversion. If not specified, derived attributes (xyz_px and xyz_nm)
                 can not be accessed
+
+    The per-emitter attributes are views of the internal storage buffers. Assigning to an attribute replaces the
+    storage, i.e. tensors and subsets obtained before keep their values. In-place operations on an attribute
+    (e.g. em.xyz += 1) however act on the storage and are therefore seen by all views of it.
     """
     _eq_precision = 1E-8
     _xy_units = ('px', 'nm')
 
+    # all per-emitter attributes live in a float (N x 11), a cramer-rao (N x 5) and an integer (N x 2) buffer
+    _buf_names = ('_buf', '_buf_cr', '_buf_int')
+    _buf_cols = 11
+    _buf_cr_cols = 5
+    _buf_int_cols = 2
+
+    # storage type of the cramer-rao values. None means same type as xyz. The values are only diagnostic, so
+    # memory can be saved by e.g. torch.bfloat16 (float16 is not recommended, it overflows for photon variances)
+    cr_dtype = None
+
+    xyz = _BufferColumn('_buf', slice(0, 3))
+    phot = _BufferColumn('_buf', 3)
+    prob = _BufferColumn('_buf', 4)
+    bg = _BufferColumn('_buf', 5)
+    xyz_sig = _BufferColumn('_buf', slice(6, 9))
+    phot_sig = _BufferColumn('_buf', 9)
+    bg_sig = _BufferColumn('_buf', 10)
+    xyz_cr = _BufferColumn('_buf_cr', slice(0, 3))
+    phot_cr = _BufferColumn('_buf_cr', 3)
+    bg_cr = _BufferColumn('_buf_cr', 4)
+    _cr = _BufferColumn('_buf_cr', slice(0, 5))  # xyz_cr, phot_cr and bg_cr as one block
+    frame_ix = _BufferColumn('_buf_int', 0)
+    id = _BufferColumn('_buf_int', 1)
+
     def __init__(self, xyz: torch.Tensor, phot: torch.Tensor, frame_ix: torch.LongTensor,
                  id: torch.LongTensor = None, prob: torch.Tensor = None, bg: torch.Tensor = None,
                  xyz_cr: torch.Tensor = None, phot_cr: torch.Tensor = None, bg_cr: torch.Tensor = None,
@@ -58,38 +136,16 @@ class EmitterSet:
                 may not be accessed because one can not convert units without pixel size.
         """
 
-        self.xyz = None
-        self.phot = None
-        self.frame_ix = None
-        self.id = None
-        self.prob = None
-        self.bg = None
-
-        # Cramer-Rao values
-        self.xyz_cr = None
-        self.phot_cr = None
-        self.bg_cr = None
-
-        # Error estimates
-        self.xyz_sig = None
-        self.phot_sig = None
-        self.bg_sig = None
+        self._buf = None  # float attributes, column layout as specified by the class attributes
+        self._buf_cr = None  # cramer-rao attributes, stored as cr_dtype
+        self._buf_int = None  # integer attributes (frame_ix, id)
 
         self._set_typed(xyz=xyz, phot=phot, frame_ix=frame_ix, id=id, prob=prob, bg=bg,
                         xyz_cr=xyz_cr, phot_cr=phot_cr, bg_cr=bg_cr,
                         xyz_sig=xyz_sig, phot_sig=phot_sig, bg_sig=bg_sig)
 
         self._sorted = False
-        # get at least one_dim tensors
-        at_least_one_dim(self.xyz,
-                         self.phot,
-                         self.frame_ix,
-                         self.id,
-                         self.prob,
-                         self.bg,
-                         self.xyz_cr,
-                         self.phot_cr,
-                         self.bg_cr)
+        self._frame_range_cache = None
 
         self.xy_unit = xy_unit
         self.px_size = px_size
@@ -129,14 +185,15 @@ class EmitterSet:
         """
         Square-Root cramer rao of xyz.
         """
-        return self.xyz_cr.sqrt()
+        return self.xyz_cr.to(self._buf.dtype).sqrt()
 
     @property
     def xyz_cr_px(self) -> torch.Tensor:
         """
         Cramer-Rao of xyz in px units.
         """
-        return self._pxnm_conversion(self.xyz_cr, in_unit=self.xy_unit, tar_unit='px', power=2)
+        return self._pxnm_conversion(self.xyz_cr.to(self._buf.dtype), in_unit=self.xy_unit, tar_unit='px',
+                                     power=2)
 
     @property
     def xyz_scr_px(self) -> torch.Tensor:
@@ -147,7 +204,8 @@ class EmitterSet:
 
     @property
     def xyz_cr_nm(self) -> torch.Tensor:
-        return self._pxnm_conversion(self.xyz_cr, in_unit=self.xy_unit, tar_unit='nm', power=2)
+        return self._pxnm_conversion(self.xyz_cr.to(self._buf.dtype), in_unit=self.xy_unit, tar_unit='nm',
+                                     power=2)
 
     @property
     def xyz_scr_nm(self) -> torch.Tensor:
@@ -155,11 +213,11 @@ class EmitterSet:
 
     @property
     def phot_scr(self) -> torch.Tensor:  # sqrt cramer-rao of photon count
-        return self.phot_cr.sqrt()
+        return self.phot_cr.to(self._buf.dtype).sqrt()
 
     @property
     def bg_scr(self) -> torch.Tensor:  # sqrt cramer-rao of bg count
-        return self.bg_cr.sqrt()
+        return self.bg_cr.to(self._buf.dtype).sqrt()
 
     @property
     def xyz_sig_px(self) -> torch.Tensor:
@@ -214,10 +272,21 @@ class EmitterSet:
 
     # pickle
     def __getstate__(self):
-        return self.to_dict()
+        state = self.__dict__.copy()
+        # a view would pickle the complete storage it is based on
+        for name, buf in zip(self._buf_names, self._bufs):
+            state[name] = buf.clone() if buf._base is not None else buf
+        state['_frame_range_cache'] = None
+        state['_sorted_key'] = None
+
+        return state
 
     def __setstate__(self, state):
-        self.__init__(**state)
+        if '_buf' not in state:  # legacy pickles store the attribute dictionary (to_dict)
+            self.__init__(**state)
+            return
+
+        self.__dict__.update(state)
 
     def save(self, file: Union[str, Path]):
         """
@@ -275,64 +344,75 @@ class EmitterSet:
 
         """Set values"""
         if num_input != 0:
-            self.xyz = xyz
-            self.phot = phot.type(f_type)
-            self.frame_ix = frame_ix.type(i_type)
+            # get at least one_dim tensors (as views, the caller's tensors are left untouched)
+            xyz, phot, frame_ix, id, prob, bg, xyz_cr, phot_cr, bg_cr, xyz_sig, phot_sig, bg_sig = at_least_one_dim(
+                xyz, phot, frame_ix, id, prob, bg, xyz_cr, phot_cr, bg_cr, xyz_sig, phot_sig, bg_sig)
+            attr = _not_none(xyz, phot, frame_ix, id, prob, bg, xyz_cr, phot_cr, bg_cr, xyz_sig, phot_sig, bg_sig)
 
-            # Optionals
-            self.id = id if id is not None else -torch.ones_like(frame_ix)
-            self.prob = prob.type(f_type) if prob is not None else torch.ones_like(frame_ix).type(f_type)
-            self.bg = bg.type(f_type) if bg is not None else float('nan') * torch.ones_like(frame_ix).type(f_type)
+            if not same_shape_tensor(0, *attr):
+                raise ValueError("Coordinates, photons, frame ix, id and prob are not of equal shape in 0th dimension.")
 
-            self.xyz_cr = xyz_cr.type(f_type) if xyz_cr is not None else float('nan') * torch.ones_like(self.xyz)
-            self.phot_cr = phot_cr.type(f_type) if phot_cr is not None else float('nan') * torch.ones_like(self.phot)
-            self.bg_cr = bg_cr.type(f_type) if bg_cr is not None else float('nan') * torch.ones_like(self.bg)
+            if not same_dim_tensor(torch.ones(1), *_not_none(phot, prob, frame_ix, id, bg, phot_cr, bg_cr,
+                                                             phot_sig, bg_sig)):
+                raise ValueError("Expected photons, probability frame index and id to be 1D.")
 
-            self.xyz_sig = xyz_sig.type(f_type) if xyz_sig is not None else float('nan') * torch.ones_like(self.xyz)
-            self.phot_sig = phot_sig.type(f_type) if phot_sig is not None else float('nan') * torch.ones_like(self.phot)
-            self.bg_sig = bg_sig.type(f_type) if bg_sig is not None else float('nan') * torch.ones_like(self.bg)
+        # assignment to the storage buffers converts to their (float / integer) type, no need to cast beforehand.
+        # The float buffer is initialised with nan once, which is the default of the unspecified optionals.
+        self._buf = torch.full((num_input, self._buf_cols), float('nan'), dtype=f_type, device=xyz.device)
+        self._buf_cr = torch.full((num_input, self._buf_cr_cols), float('nan'),
+                                  dtype=self.cr_dtype if self.cr_dtype is not None else f_type, device=xyz.device)
+        self._buf_int = torch.empty((num_input, self._buf_int_cols), dtype=i_type, device=xyz.device)
 
-        else:
-            self.xyz = torch.zeros((0, 3)).type(f_type)
-            self.phot = torch.zeros((0,)).type(f_type)
-            self.frame_ix = torch.zeros((0,)).type(i_type)
+        if num_input != 0:
+            # the buffers were just allocated, write into them directly instead of replacing them on every assignment
+            cls = type(self)
+            cls.xyz.write(self, xyz)
+            cls.phot.write(self, phot)
+            cls.frame_ix.write(self, frame_ix)
+
+            cls.id.write(self, id if id is not None else -1)
+            cls.prob.write(self, prob if prob is not None else 1.)
 
-            # Optionals
-            self.id = -torch.ones((0,)).type(i_type)
-            self.prob = torch.ones((0,)).type(f_type)
-            self.bg = float('nan') * torch.ones_like(self.prob)
+            for attr_name, attr_val in (('bg', bg), ('xyz_cr', xyz_cr), ('phot_cr', phot_cr), ('bg_cr', bg_cr),
+                                        ('xyz_sig', xyz_sig), ('phot_sig', phot_sig), ('bg_sig', bg_sig)):
+                if attr_val is not None:
+                    getattr(cls, attr_name).write(self, attr_val)
+
+    @property
+    def _bufs(self) -> tuple:
+        """
+        The storage buffers in the order of _buf_names.
+        """
+        return self._buf, self._buf_cr, self._buf_int
 
-            self.xyz_cr = float('nan') * torch.ones((0, 3)).type(f_type)
-            self.phot_cr = float('nan') * torch.ones_like(self.prob)
-            self.bg_cr = float('nan') * torch.ones_like(self.bg)
+    @staticmethod
+    def _from_buffers(bufs, xy_unit: str, px_size: torch.Tensor):
+        """
+        Creates an EmitterSet directly from its storage buffers (in the order of _buf_names), bypassing type
+        conversion and sanity checks.
+        """
+        em = EmitterSet.__new__(EmitterSet)
+        em._buf, em._buf_cr, em._buf_int = bufs
+        em._sorted = False
+        em._frame_range_cache = None
+        em.xy_unit = xy_unit
+        em.px_size = px_size
 
-            self.xyz_sig = float('nan') * torch.ones((0, 3)).type(f_type)
-            self.phot_sig = float('nan') * torch.ones_like(self.prob)
-            self.bg_sig = float('nan') * torch.ones_like(self.bg)
+        return em
 
     def _inplace_replace(self, em):
         """
-        Inplace replacement of this self instance. Does not work for inherited methods ...
+        Inplace replacement of this self instance.
+
         Args:
             em: other EmitterSet instance that should replace self
 
-
         """
-        self.__init__(xyz=em.xyz,
-                      phot=em.phot,
-                      frame_ix=em.frame_ix,
-                      id=em.id,
-                      prob=em.prob,
-                      bg=em.bg,
-                      xyz_cr=em.xyz_cr,
-                      phot_cr=em.phot_cr,
-                      bg_cr=em.bg_cr,
-                      xyz_sig=em.xyz_sig,
-                      phot_sig=em.phot_sig,
-                      bg_sig=em.bg_sig,
-                      sanity_check=True,
-                      xy_unit=em.xy_unit,
-                      px_size=em.px_size)
+        self._buf, self._buf_cr, self._buf_int = em._bufs
+        self._sorted = em._sorted
+        self._frame_range_cache = em._frame_range_cache
+        self.xy_unit = em.xy_unit
+        self.px_size = em.px_size
 
     def _sanity_check(self, check_uniqueness=False):
         """
@@ -344,13 +424,6 @@ class EmitterSet:
         Returns:
             (bool) sane or not sane
         """
-        if not same_shape_tensor(0, self.xyz, self.phot, self.frame_ix, self.id, self.bg,
-                                 self.xyz_cr, self.phot_cr, self.bg_cr):
-            raise ValueError("Coordinates, photons, frame ix, id and prob are not of equal shape in 0th dimension.")
-
-        if not same_dim_tensor(torch.ones(1), self.phot, self.prob, self.frame_ix, self.id):
-            raise ValueError("Expected photons, probability frame index and id to be 1D.")
-
         # Motivate the user to specify an xyz unit.
         if len(self) > 0:
             if self.xy_unit is None:
@@ -366,6 +439,44 @@ class EmitterSet:
 
         return True
 
+    @property
+    def _sorted(self) -> bool:
+        """
+        Whether the emitters are known to be sorted by frame index, i.e. they were sorted and the integer buffer has
+        not been modified or replaced since.
+        """
+        key = self._sorted_key
+        return key is not None and key[0] is self._buf_int and key[1] == self._buf_int._version
+
+    @_sorted.setter
+    def _sorted(self, sorted: bool):
+        # the last entry caches the contiguous frame index, see _sorted_frame_ix
+        self._sorted_key = [self._buf_int, self._buf_int._version, None] if sorted else None
+
+    def _sorted_frame_ix(self) -> torch.Tensor:
+        """
+        Contiguous frame index of a sorted set (as needed by searchsorted). Cached as long as the set stays sorted.
+        """
+        key = self._sorted_key
+        if key[2] is None:
+            key[2] = self.frame_ix.contiguous()
+
+        return key[2]
+
+    def _frame_range(self) -> tuple:
+        """
+        Returns min and max frame index. The result is cached until the integer buffer is modified or replaced.
+
+        Returns:
+            (int, int) min and max frame index
+        """
+        cache = self._frame_range_cache
+        if cache is None or cache[0] is not self._buf_int or cache[1] != self._buf_int._version:
+            cache = (self._buf_int, self._buf_int._version, self.frame_ix.min().item(), self.frame_ix.max().item())
+            self._frame_range_cache = cache
+
+        return cache[2], cache[3]
+
     def __len__(self):
         """
         Implements length of EmitterSet. Length of EmitterSet is number of rows of xyz container.
@@ -390,7 +501,7 @@ class EmitterSet:
         if len(self) >= 1:
             print_str += f"\n::xy unit: {self.xy_unit}"
             print_str += f"\n::px size: {self.px_size}"
-            print_str += f"\n::frame range: {self.frame_ix.min().item()} - {self.frame_ix.max().item()}" \
+            print_str += f"\n::frame range: {self._frame_range()[0]} - {self._frame_range()[1]}" \
                          f"\n::spanned volume: {self.xyz.min(0)[0].numpy()} - {self.xyz.max(0)[0].numpy()}"
         return print_str
 
@@ -406,27 +517,24 @@ class EmitterSet:
             true if as stated above.
 
         """
-        def check_em_dict_equality(em_a: dict, em_b: dict) -> bool:
-
-            for k in em_a.keys():
-                 if not tutil.tens_almeq(em_a[k], em_b[k], nan=True):
-                     return False
-
-            return True
+        if any(buf.size() != buf_other.size() or buf.dtype != buf_other.dtype
+               for buf, buf_other in zip(self._bufs, other._bufs)):
+            return False
 
         if not self.eq_attr(other):
             return False
 
-        self_dict = self.to_dict()
-        self_dict.pop('xy_unit')
-        self_dict.pop('px_size')
+        if not torch.equal(self._buf_int, other._buf_int):
+            return False
 
-        other_dict = other.to_dict()
-        other_dict.pop('xy_unit')
-        other_dict.pop('px_size')
+        for buf, buf_other in ((self._buf, other._buf), (self._buf_cr, other._buf_cr)):
+            # exit early on a value mismatch (a nan difference does not count here) ...
+            if ((buf - buf_other).abs() >= self._eq_precision).any():
+                return False
 
-        if not check_em_dict_equality(self_dict, other_dict):
-            return False
+            # ... because nan's are considered equal if they are at the same position
+            if not torch.equal(buf.isnan(), buf_other.isnan()):
+                return False
 
         return True
 
@@ -503,21 +611,11 @@ class EmitterSet:
             EmitterSet
 
         """
-        return EmitterSet(xyz=self.xyz.clone(),
-                          phot=self.phot.clone(),
-                          frame_ix=self.frame_ix.clone(),
-                          id=self.id.clone(),
-                          prob=self.prob.clone(),
-                          bg=self.bg.clone(),
-                          xyz_cr=self.xyz_cr.clone(),
-                          phot_cr=self.phot_cr.clone(),
-                          bg_cr=self.bg_cr.clone(),
-                          xyz_sig=self.xyz_sig.clone(),
-                          phot_sig=self.phot_sig.clone(),
-                          bg_sig=self.bg_sig.clone(),
-                          sanity_check=False,
-                          xy_unit=self.xy_unit,
-                          px_size=self.px_size)
+        em = self._from_buffers([buf.clone(memory_format=torch.contiguous_format) for buf in self._bufs],
+                                xy_unit=self.xy_unit, px_size=self.px_size)
+        em._sorted = self._sorted
+
+        return em
 
     @staticmethod
     def cat(emittersets: list, remap_frame_ix: Union[None, torch.Tensor] = None, step_frame_ix: int = None):
@@ -535,53 +633,30 @@ class EmitterSet:
             EmitterSet concatenated emitterset
 
         """
-        num_emittersets = len(emittersets)
-
         if remap_frame_ix is not None and step_frame_ix is not None:
             raise ValueError("You cannot specify remap frame ix and step frame ix at the same time.")
         elif remap_frame_ix is not None:
-            shift = remap_frame_ix.clone()
+            shift = remap_frame_ix
         elif step_frame_ix is not None:
-            shift = torch.arange(0, num_emittersets) * step_frame_ix
+            shift = torch.arange(0, len(emittersets)) * step_frame_ix
         else:
-            shift = torch.zeros(num_emittersets).int()
-
-        total_num_emitter = 0
-        for i in range(num_emittersets):
-            total_num_emitter += len(emittersets[i])
-
-        xyz = torch.cat([emittersets[i].xyz for i in range(num_emittersets)], 0)
-        phot = torch.cat([emittersets[i].phot for i in range(num_emittersets)], 0)
-        frame_ix = torch.cat([emittersets[i].frame_ix + shift[i] for i in range(num_emittersets)], 0)
-        id = torch.cat([emittersets[i].id for i in range(num_emittersets)], 0)
-        prob = torch.cat([emittersets[i].prob for i in range(num_emittersets)], 0)
-        bg = torch.cat([emittersets[i].bg for i in range(num_emittersets)], 0)
+            shift = None
 
-        xyz_cr = torch.cat([emittersets[i].xyz_cr for i in range(num_emittersets)], 0)
-        phot_cr = torch.cat([emittersets[i].phot_cr for i in range(num_emittersets)], 0)
-        bg_cr = torch.cat([emittersets[i].bg_cr for i in range(num_emittersets)], 0)
+        # torch.cat allocates each output buffer once, filling it in a single kernel rather than slice by slice
+        num_emitter = [len(em) for em in emittersets]
+        buf, buf_cr, buf_int = [torch.cat(bufs, 0) for bufs in zip(*[em._bufs for em in emittersets])]
 
-        xyz_sig = torch.cat([emittersets[i].xyz_sig for i in range(num_emittersets)], 0)
-        phot_sig = torch.cat([emittersets[i].phot_sig for i in range(num_emittersets)], 0)
-        bg_sig = torch.cat([emittersets[i].bg_sig for i in range(num_emittersets)], 0)
+        if shift is not None:  # shift frame index of each emitterset, in place on the output
+            # repeat on the host where the counts live, then move the result to the device in one copy
+            shift = shift.to('cpu', buf_int.dtype).repeat_interleave(torch.tensor(num_emitter))
+            buf_int[:, 0] += shift.to(buf_int.device)
 
         # px_size and xy unit is taken from the first element that is not None
-        xy_unit = None
-        px_size = None
-        for i in range(num_emittersets):
-            if emittersets[i].xy_unit is not None:
-                xy_unit = emittersets[i].xy_unit
-                break
-        for i in range(num_emittersets):
-            if emittersets[i].px_size is not None:
-                px_size = emittersets[i].px_size
-                break
-
-        return EmitterSet(xyz, phot, frame_ix, id, prob, bg,
-                          xyz_cr=xyz_cr, phot_cr=phot_cr, bg_cr=bg_cr,
-                          xyz_sig=xyz_sig, phot_sig=phot_sig, bg_sig=bg_sig,
-                          sanity_check=True,
-                          xy_unit=xy_unit, px_size=px_size)
+        xy_unit = next((em.xy_unit for em in emittersets if em.xy_unit is not None), None)
+        px_size = next((em.px_size for em in emittersets if em.px_size is not None), None)
+
+        # inputs were checked on their construction
+        return EmitterSet._from_buffers((buf, buf_cr, buf_int), xy_unit=xy_unit, px_size=px_size)
 
     def sort_by_frame_(self):
         """
@@ -600,8 +675,11 @@ class EmitterSet:
 
         """
         _, ix = self.frame_ix.sort()
-        em = self[ix]
+        em = self._from_buffers([buf.index_select(0, ix) for buf in self._bufs],
+                                xy_unit=self.xy_unit, px_size=self.px_size)
         em._sorted = True
+        if len(em) >= 1:  # first and last element are min and max for free
+            em._frame_range_cache = (em._buf_int, em._buf_int._version, em.frame_ix[0].item(), em.frame_ix[-1].item())
 
         return em
 
@@ -625,11 +703,13 @@ class EmitterSet:
         if isinstance(ix, (np.ndarray, np.generic)) and ix.size == 1:  # numpy support
             ix = [int(ix)]
 
-        return EmitterSet(xyz=self.xyz[ix], phot=self.phot[ix], frame_ix=self.frame_ix[ix], id=self.id[ix],
-                          prob=self.prob[ix], bg=self.bg[ix],
-                          xyz_sig=self.xyz_sig[ix], phot_sig=self.phot_sig[ix], bg_sig=self.bg_sig[ix],
-                          xyz_cr=self.xyz_cr[ix], phot_cr=self.phot_cr[ix], bg_cr=self.bg_cr[ix],
-                          sanity_check=False, xy_unit=self.xy_unit, px_size=self.px_size)
+        # integer index tensors take the contiguous gather path instead of advanced indexing
+        if isinstance(ix, torch.Tensor) and ix.dtype == torch.long and ix.dim() == 1:
+            ix = torch.where(ix < 0, ix + len(self), ix)  # index_select does not wrap negative indices
+            return self._from_buffers([buf.index_select(0, ix) for buf in self._bufs],
+                                      xy_unit=self.xy_unit, px_size=self.px_size)
+
+        return self._from_buffers([buf[ix] for buf in self._bufs], xy_unit=self.xy_unit, px_size=self.px_size)
 
     def get_subset_frame(self, frame_start, frame_end, frame_ix_shift=None):
         """
@@ -644,8 +724,15 @@ class EmitterSet:
 
         """
 
-        ix = (self.frame_ix >= frame_start) * (self.frame_ix <= frame_end)
-        em = self[ix]
+        # frame range of a sorted set is a contiguous block, find its limits instead of masking (needs finite bounds)
+        if self._sorted and math.isfinite(frame_start) and math.isfinite(frame_end):
+            frame_ix = self._sorted_frame_ix()
+            lo = torch.searchsorted(frame_ix, math.ceil(frame_start)).item()
+            hi = torch.searchsorted(frame_ix, math.floor(frame_end), right=True).item()
+            em = self[lo:hi].clone()
+        else:
+            ix = torch.logical_and(self.frame_ix >= frame_start, self.frame_ix <= frame_end)
+            em = self[ix]
 
         if not frame_ix_shift:
             return em
@@ -740,13 +827,32 @@ class EmitterSet:
         Returns:
             list
 
+        Note:
+            The returned EmitterSets are slices of one sorted copy of this set's storage, i.e. they are independent
+            of this set but in-place operations on them act on their own rows of that shared copy only.
+
         """
 
         """The first frame is assumed to be 0. If it's negative go to the lowest negative."""
-        ix_low = ix_low if ix_low is not None else self.frame_ix.min().item()
-        ix_up = ix_up if ix_up is not None else self.frame_ix.max().item()
+        ix_low = ix_low if ix_low is not None else self._frame_range()[0]
+        ix_up = ix_up if ix_up is not None else self._frame_range()[1]
 
-        return gutil.split_sliceable(x=self, x_ix=self.frame_ix, ix_low=ix_low, ix_high=ix_up)
+        # sorting (and gathering) can be skipped if the frame index is already in order, a plain copy suffices
+        if self._sorted or (self.frame_ix[1:] >= self.frame_ix[:-1]).all():
+            em = self.clone()
+        else:
+            em = self.sort_by_frame()
+        frame_ix = em.frame_ix.contiguous()
+
+        """
+        arange( + 2) because + 1 for pythonic and another + 1 because the start of the next frame is the end of the
+        current one
+        """
+        picker = torch.arange(ix_low, max(ix_low, ix_up + 2), dtype=frame_ix.dtype, device=frame_ix.device)
+        bounds = torch.searchsorted(frame_ix, picker).tolist()
+
+        return [em._from_buffers([buf[lo:hi] for buf in em._bufs], xy_unit=em.xy_unit, px_size=em.px_size)
+                for lo, hi in zip(bounds[:-1], bounds[1:])]
 
     def _pxnm_conversion(self, xyz, in_unit, tar_unit, power: float = 1.):
 
@@ -815,10 +921,11 @@ class EmitterSet:
 
         """
 
+        if len(self) == 0:  # nothing to compute, spare the psf its (batched) call on empty input
+            return
+
         crlb, _ = psf.crlb(self.xyz, self.phot, self.bg, **kwargs)
-        self.xyz_cr = crlb[:, :3]
-        self.phot_cr = crlb[:, 3]
-        self.bg_cr = crlb[:, 4]
+        self._cr = crlb  # x, y, z, phot, bg in one copy (and conversion to cr_dtype)
 
 
 class RandomEmitterSet(EmitterSet):
@@ -831,20 +938,6 @@ class RandomEmitterSet(EmitterSet):
         super().__init__(xyz, torch.ones_like(xyz[:, 0]), torch.zeros_like(xyz[:, 0]).long(),
                          xy_unit=xy_unit, px_size=px_size)
 
-    def _inplace_replace(self, em):
-        super().__init__(xyz=em.xyz,
-                         phot=em.phot,
-                         frame_ix=em.frame_ix,
-                         id=em.id,
-                         prob=em.prob,
-                         bg=em.bg,
-                         xyz_cr=em.xyz_cr,
-                         phot_cr=em.phot_cr,
-                         bg_cr=em.bg_cr,
-                         sanity_check=False,
-                         xy_unit=em.xy_unit,
-                         px_size=em.px_size)
-
 
 class CoordinateOnlyEmitter(EmitterSet):
     """
@@ -860,40 +953,22 @@ class CoordinateOnlyEmitter(EmitterSet):
         super().__init__(xyz, torch.ones_like(xyz[:, 0]), torch.zeros_like(xyz[:, 0]).int(),
                          xy_unit=xy_unit, px_size=px_size)
 
-    def _inplace_replace(self, em):
-        super().__init__(xyz=em.xyz,
-                         phot=em.phot,
-                         frame_ix=em.frame_ix,
-                         id=em.id,
-                         prob=em.prob,
-                         bg=em.bg,
-                         xyz_cr=em.xyz_cr,
-                         phot_cr=em.phot_cr,
-                         bg_cr=em.bg_cr,
-                         sanity_check=False,
-                         xy_unit=em.xy_unit,
-                         px_size=em.px_size)
-
 
 class EmptyEmitterSet(CoordinateOnlyEmitter):
     """An empty emitter set."""
 
     def __init__(self, xy_unit=None, px_size=None):
-        super().__init__(torch.zeros((0, 3)), xy_unit=xy_unit, px_size=px_size)
+        # nothing to type-check or validate, set up the empty buffers directly
+        self._buf = torch.zeros((0, self._buf_cols))
+        self._buf_cr = torch.zeros((0, self._buf_cr_cols), dtype=self.cr_dtype)
+        self._buf_int = torch.zeros((0, self._buf_int_cols), dtype=torch.int64)
+        self._sorted = True
+        self._frame_range_cache = None
 
-    def _inplace_replace(self, em):
-        super().__init__(xyz=em.xyz,
-                         phot=em.phot,
-                         frame_ix=em.frame_ix,
-                         id=em.id,
-                         prob=em.prob,
-                         bg=em.bg,
-                         xyz_cr=em.xyz_cr,
-                         phot_cr=em.phot_cr,
-                         bg_cr=em.bg_cr,
-                         sanity_check=False,
-                         xy_unit=em.xy_unit,
-                         px_size=em.px_size)
+        self.xy_unit = xy_unit
+        self.px_size = px_size
+        if self.px_size is not None and not isinstance(self.px_size, torch.Tensor):
+            self.px_size = torch.Tensor(self.px_size)
 
 
 class LooseEmitterSet:
@@ -973,66 +1048,25 @@ class LooseEmitterSet:
 
         """
 
-        def cum_count_per_group(arr):
-            """
-            Helper function that returns the cumulative sum per group.
-
-            Example:
-                [0, 0, 0, 1, 2, 2, 0] --> [0, 1, 2, 0, 0, 1, 3]
-            """
-
-            def grp_range(counts: torch.Tensor):
-                assert counts.dim() == 1
+        frame_start = torch.floor(self.t0).long()
+        frame_last = torch.floor(self.te).long()
+        frame_count = frame_last - frame_start + 1  # number of frames touched by each emitter
 
-                idx = counts.cumsum(0)
-                id_arr = torch.ones(idx[-1], dtype=int)
-                id_arr[0] = 0
-                id_arr[idx[:-1]] = -counts[:-1] + 1
-                return id_arr.cumsum(0)
+        """Repeat each emitter by the number of frames it is on"""
+        xyz_ = self.xyz.repeat_interleave(frame_count, dim=0)
+        id_ = self.id.repeat_interleave(frame_count, dim=0)
+        flux_ = self.intensity.repeat_interleave(frame_count, dim=0)
+        t0_ = self.t0.repeat_interleave(frame_count, dim=0)
+        te_ = self.te.repeat_interleave(frame_count, dim=0)
 
-            if arr.numel() == 0:
-                return arr
+        # frame index relative to the first frame of the respective emitter, i.e. [0, 1, 2, 0, 0, 1, ...]
+        offset = (frame_count.cumsum(0) - frame_count).repeat_interleave(frame_count, dim=0)
+        frame_ix_ = frame_start.repeat_interleave(frame_count, dim=0) \
+            + torch.arange(offset.size(0), device=offset.device) - offset
 
-            _, cnt = torch.unique(arr, return_counts=True)
-            return grp_range(cnt)[torch.argsort(arr).argsort()]
-
-        frame_start = torch.floor(self.t0).long()
-        frame_last = torch.floor(self.te).long()
-        frame_count = (frame_last - frame_start).long()
-
-        frame_count_full = frame_count - 2
-        ontime_first = torch.min(self.te - self.t0, frame_start + 1 - self.t0)
-        ontime_last = torch.min(self.te - self.t0, self.te - frame_last)
-
-        """Repeat by full-frame duration"""
-
-        # kick out everything that has no full frame_duration
-        ix_full = frame_count_full >= 0
-        xyz_ = self.xyz[ix_full, :]
-        flux_ = self.intensity[ix_full]
-        id_ = self.id[ix_full]
-        frame_start_full = frame_start[ix_full]
-        frame_dur_full_clean = frame_count_full[ix_full]
-
-        xyz_ = xyz_.repeat_interleave(frame_dur_full_clean + 1, dim=0)
-        phot_ = flux_.repeat_interleave(frame_dur_full_clean + 1, dim=0)  # because intensity * 1 = phot
-        id_ = id_.repeat_interleave(frame_dur_full_clean + 1, dim=0)
-        # because 0 is first occurence
-        frame_ix_ = frame_start_full.repeat_interleave(frame_dur_full_clean + 1, dim=0) + cum_count_per_group(id_) + 1
-
-        """First frame"""
-        # first
-        xyz_ = torch.cat((xyz_, self.xyz), 0)
-        phot_ = torch.cat((phot_, self.intensity * ontime_first), 0)
-        id_ = torch.cat((id_, self.id), 0)
-        frame_ix_ = torch.cat((frame_ix_, frame_start), 0)
-
-        # last (only if frame_last != frame_first
-        ix_with_last = frame_last >= frame_start + 1
-        xyz_ = torch.cat((xyz_, self.xyz[ix_with_last]))
-        phot_ = torch.cat((phot_, self.intensity[ix_with_last] * ontime_last[ix_with_last]), 0)
-        id_ = torch.cat((id_, self.id[ix_with_last]), 0)
-        frame_ix_ = torch.cat((frame_ix_, frame_last[ix_with_last]))
+        """On-time within each frame times intensity"""
+        frame_t_ = frame_ix_.type(t0_.dtype)
+        phot_ = (torch.min(te_, frame_t_ + 1) - torch.max(t0_, frame_t_)) * flux_
 
         return xyz_, phot_, frame_ix_, id_
 
@@ -1049,27 +1083,17 @@ class LooseEmitterSet:
         return EmitterSet(xyz_, phot_, frame_ix_.long(), id_.long(), xy_unit=self.xy_unit, px_size=self.px_size)
 
 
-def at_least_one_dim(*args):
-    for arg in args:
-        if arg.dim() == 0:
-            arg.unsqueeze_(0)
+def at_least_one_dim(*args) -> list:
+    return [arg.unsqueeze(0) if arg is not None and arg.dim() == 0 else arg for arg in args]
 
 
-def same_shape_tensor(dim, *args):
-    for i in range(args.__len__() - 1):
-        if args[i].size(dim) == args[i + 1].size(dim):
-            continue
-        else:
-            return False
+def _not_none(*args) -> list:
+    return [arg for arg in args if arg is not None]
 
-    return True
 
+def same_shape_tensor(dim, *args) -> bool:
+    return all(arg.size(dim) == args[0].size(dim) for arg in args[1:])
 
-def same_dim_tensor(*args):
-    for i in range(args.__len__() - 1):
-        if args[i].dim() == args[i + 1].dim():
-            continue
-        else:
-            return False
 
-    return True
\ No newline at end of file
+def same_dim_tensor(*args) -> bool:
+    return all(arg.dim() == args[0].dim() for arg in args[1:])
@@ -1,4 +1,3 @@
-import numpy as np
 import torch
 
 
@@ -37,10 +36,10 @@ def split_sliceable(x, x_ix: torch.Tensor, ix_low: int, ix_high: int):
     arange( + 2) because + 1 for pythonic and another + 1 because the loop before return below goes from 0 to on 
     range('len' - 1)
     """
-    picker = np.arange(ix_low, ix_high + 2)
-    ix_sort = np.searchsorted(x_ix, picker)
+    picker = torch.arange(ix_low, max(ix_low, ix_high + 2), dtype=x_ix.dtype, device=x_ix.device)
+    ix_sort = torch.searchsorted(x_ix, picker).tolist()
 
-    return [x[ix_sort[i]:ix_sort[i + 1]] for i in range(ix_sort.shape[0] - 1)]
+    return [x[ix_sort[i]:ix_sort[i + 1]] for i in range(len(ix_sort) - 1)]
 
 
 def ix_split(ix: torch.Tensor, ix_min: int, ix_max: int):
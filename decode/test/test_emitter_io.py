@@ -0,0 +1,72 @@
+import copy
+
+import pandas as pd
+import pytest
+import torch
+
+import decode.utils.emitter_io as emitter_io
+from decode.generic.emitter import RandomEmitterSet
+
+
+@pytest.fixture()
+def em_dict():
+    em = RandomEmitterSet(20, xy_unit='px', px_size=(100., 100.))
+    em.xyz_cr = torch.rand_like(em.xyz)
+
+    return em.to_dict()
+
+
+def test_save_load_csv(tmpdir, em_dict):
+    file = tmpdir / 'emitters.csv'
+    emitter_io.save_csv(file, em_dict)
+
+    """Column order of a full emitter dict"""
+    assert list(pd.read_csv(file).columns) == \
+        ['x', 'y', 'z', 'phot', 'frame_ix', 'id', 'prob', 'bg', 'phot_cr', 'bg_cr', 'phot_sig', 'bg_sig', 'xy_unit',
+         'x_cr', 'y_cr', 'z_cr', 'x_sig', 'y_sig', 'z_sig']
+
+    """Loaded dict lacks optional attributes but must be writable again"""
+    em_loaded = emitter_io.load_csv(file)
+    assert (em_loaded['xyz'] == em_dict['xyz']).all()
+    assert (em_loaded['frame_ix'] == em_dict['frame_ix']).all()
+
+    emitter_io.save_csv(tmpdir / 'emitters_resave.csv', em_loaded)
+
+
+def save_csv_ref(file, data: dict):
+    """Reference implementation, deep copies the data before conversion."""
+    data = copy.deepcopy(data)
+    data.pop('px_size')
+    data = {k: v.numpy() if isinstance(v, torch.Tensor) else v for k, v in data.items()}
+    xyz, xyz_cr, xyz_sig = data.pop('xyz'), data.pop('xyz_cr'), data.pop('xyz_sig')
+
+    data_one_dim = {'x': xyz[:, 0], 'y': xyz[:, 1], 'z': xyz[:, 2]}
+    data_one_dim.update(data)
+    data_one_dim.update({'x_cr': xyz_cr[:, 0], 'y_cr': xyz_cr[:, 1], 'z_cr': xyz_cr[:, 2]})
+    data_one_dim.update({'x_sig': xyz_sig[:, 0], 'y_sig': xyz_sig[:, 1], 'z_sig': xyz_sig[:, 2]})
+
+    pd.DataFrame.from_dict(data_one_dim).to_csv(file, index=False)
+
+
+def test_save_csv_unmodified(tmpdir, em_dict):
+    em_dict_ref = copy.deepcopy(em_dict)
+
+    emitter_io.save_csv(tmpdir / 'emitters.csv', em_dict)
+    save_csv_ref(tmpdir / 'emitters_ref.csv', em_dict_ref)
+
+    """Caller's dict and tensors are left as they are"""
+    assert em_dict.keys() == em_dict_ref.keys()
+    for k, v in em_dict.items():
+        if isinstance(v, torch.Tensor):
+            assert isinstance(em_dict_ref[k], torch.Tensor)
+            assert torch.equal(v.isnan(), em_dict_ref[k].isnan())
+            assert (v[~v.isnan()] == em_dict_ref[k][~v.isnan()]).all()
+        else:
+            assert v == em_dict_ref[k]
+
+    assert (tmpdir / 'emitters.csv').read() == (tmpdir / 'emitters_ref.csv').read()
+
+    """Tensors that require grad can be written as well"""
+    em_dict['xyz'] = em_dict['xyz'].clone().requires_grad_(True)
+    emitter_io.save_csv(tmpdir / 'emitters_grad.csv', em_dict)
+    assert (tmpdir / 'emitters_grad.csv').read() == (tmpdir / 'emitters_ref.csv').read()
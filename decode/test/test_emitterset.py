@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+import pickle
 from copy import deepcopy
 
 import numpy as np
@@ -66,6 +67,15 @@ class TestEmitterSet:
 
         assert em3d.frame_ix.dtype in (torch.int, torch.long, torch.short)
 
+    def test_type_conversion(self):
+        em = EmitterSet(torch.rand(5, 3), torch.rand(5).double(), torch.zeros(5).int(), id=torch.arange(5).short(),
+                        bg=torch.ones(5).half())
+
+        assert em.phot.dtype == em.bg.dtype == em.xyz.dtype
+        assert em.frame_ix.dtype == em.id.dtype == torch.long
+        assert (em.bg == 1.).all()
+        assert torch.isnan(em.xyz_cr).all()
+
     xyz_conversion_data = [  # xyz_input, # xy_unit, #px-size # expect px, # expect nm
         (torch.empty((0, 3)), None, None, "err", "err"),
         (torch.empty((0, 3)), 'px', None, torch.empty((0, 3)), "err"),
@@ -151,6 +161,168 @@ class TestEmitterSet:
     #     assert sum([len(e) for e in splits]) == len(big_em)
     #     assert re_merged == big_em
 
+    def test_zero_dim_input(self):
+        phot = torch.tensor(5.)
+        em = EmitterSet(torch.rand((1, 3)), phot, torch.tensor(2), id=torch.tensor(0))
+
+        assert phot.dim() == 0, "Input tensor must not be modified."
+        assert em.phot.size() == torch.Size([1])
+        assert em.frame_ix.item() == 2
+        assert em.id.item() == 0
+
+    def test_buffer_attributes(self, em3d):
+        """Attributes are views of the storage buffer, assignment writes to the buffer."""
+
+        em3d.phot = torch.arange(25).float()
+        assert (em3d._buf[:, 3] == torch.arange(25).float()).all()
+
+        with pytest.raises(ValueError):
+            em3d.phot = torch.rand(24)
+
+        with pytest.raises(ValueError):  # no broadcast of one column into xyz
+            em3d.xyz = torch.rand(25, 1)
+
+        with pytest.raises(ValueError):
+            em3d.xyz_sig = torch.rand(25)
+
+        with pytest.raises(ValueError):  # integer attributes must not be truncated
+            em3d.frame_ix = torch.rand(25)
+
+        with pytest.raises(ValueError):
+            em3d.id = 0.5
+
+        em3d.frame_ix = torch.arange(25, dtype=torch.int) + 1
+        em3d.xyz_cr = 1.
+        assert (em3d.frame_ix == torch.arange(25) + 1).all()
+        assert (em3d.xyz_cr == 1.).all()
+
+        """Assignment replaces the storage, views and subsets obtained before keep their values"""
+        xyz, xyz_ref = em3d.xyz, em3d.xyz.clone()
+        phot_ref = em3d.phot.clone()
+        em_sub = em3d[:3]
+        em_dict = em3d.to_dict()
+
+        em3d.xyz = torch.zeros(25, 3)
+        em3d.phot = torch.zeros(25)
+        assert (xyz == xyz_ref).all()
+        assert (em_sub.phot == phot_ref[:3]).all()
+        assert (em_dict['phot'] == phot_ref).all()
+
+        """In-place operations act on the storage"""
+        phot = em3d.phot
+        em3d.phot += 1
+        assert (phot == 1).all()
+
+        """Assignment on a slice must not alter the parent set"""
+        em_sub = em3d[:10]
+        em_sub.frame_ix = torch.zeros_like(em_sub.frame_ix)
+        assert (em3d.frame_ix[:10] != 0).any()
+
+        """Pickle"""
+        em_re = pickle.loads(pickle.dumps(em_sub))
+        assert em_re == em_sub
+        assert em_re._buf.size(0) == 10
+
+    def test_pickle_legacy(self, em3d, monkeypatch):
+        """Pickles of previous versions stored the attribute dictionary"""
+        with monkeypatch.context() as m:
+            m.setattr(EmitterSet, '__getstate__', EmitterSet.to_dict)
+            em_pickled = pickle.dumps(em3d)
+
+        em = pickle.loads(em_pickled)
+        assert em == em3d
+        assert len(em.split_in_frames(None, None)) == 24
+
+    def test_populate_crlb(self, em3d):
+        class DummyPSF:
+            def crlb(self, xyz, phot, bg):
+                return torch.cat((xyz, phot.unsqueeze(1), torch.ones_like(phot).unsqueeze(1)), 1), None
+
+        em3d.populate_crlb(DummyPSF())
+
+        assert (em3d.xyz_cr == em3d.xyz).all()
+        assert (em3d.phot_cr == em3d.phot).all()
+        assert (em3d.bg_cr == 1.).all()
+
+        """Empty set must not call the psf"""
+        class FailingPSF:
+            def crlb(self, *args, **kwargs):
+                raise RuntimeError
+
+        em = EmptyEmitterSet()
+        em.populate_crlb(FailingPSF())
+        assert len(em) == 0
+
+    def test_cr_dtype(self, monkeypatch):
+        monkeypatch.setattr(EmitterSet, 'cr_dtype', torch.bfloat16)
+
+        em = EmitterSet(torch.rand((10, 3)), torch.rand(10), torch.arange(10), xyz_cr=torch.rand((10, 3)) + 1,
+                        phot_cr=torch.rand(10) * 1e6, xy_unit='px')
+
+        assert em.xyz.dtype == torch.float
+        assert em.xyz_cr.dtype == torch.bfloat16
+        assert em.xyz_scr.dtype == torch.float
+        for attr in ('xyz_cr_px', 'xyz_scr_px', 'phot_scr', 'bg_scr'):
+            assert getattr(em, attr).dtype == torch.float
+
+        em.xy_unit = 'nm'
+        for attr in ('xyz_cr_nm', 'xyz_scr_nm'):
+            assert getattr(em, attr).dtype == torch.float
+        em.xy_unit = 'px'
+        assert torch.isfinite(em.phot_cr).all()
+        assert em.bg_cr.isnan().all()
+
+        assert em == em.clone()
+        assert EmitterSet.cat([em, em]).xyz_cr.dtype == torch.bfloat16
+        assert (em.split_in_frames(0, 9)[3].xyz_cr == em.xyz_cr[3]).all()
+
+    def test_frame_range(self, em3d):
+        assert em3d._frame_range() == (1, 24)
+        assert em3d.sort_by_frame()._frame_range() == (1, 24)
+
+        """Cache must be invalidated on modification"""
+        em3d.frame_ix += 1
+        assert em3d._frame_range() == (2, 25)
+
+        em3d.frame_ix[5] = -5
+        assert em3d._frame_range() == (-5, 25)
+
+    def test_get_subset(self, em3d):
+        em_sub = em3d[torch.tensor([-1, -2])]
+        assert len(em_sub) == 2
+        assert (em_sub.xyz == em3d.xyz[[-1, -2]]).all()
+        assert (em_sub.frame_ix == torch.tensor([24, 23])).all()
+
+        with pytest.raises(IndexError):
+            _ = em3d[torch.tensor([-26])]
+
+    @pytest.mark.parametrize("sort", [False, True])
+    def test_get_subset_frame(self, em3d, sort):
+        em = em3d.sort_by_frame() if sort else em3d
+        frame_ix = em.frame_ix.clone()
+
+        em_sub = em.get_subset_frame(3, 6, frame_ix_shift=-3)
+        assert len(em_sub) == 4
+        assert (em_sub.frame_ix == torch.arange(4)).all()
+        assert (em.frame_ix == frame_ix).all()  # original unchanged
+
+        """Non-integer bounds"""
+        assert len(em.get_subset_frame(2.5, 6.5)) == len(em.get_subset_frame(3, 6))
+
+        """Sorted flag must not survive modification"""
+        em.frame_ix = torch.randint_like(em.frame_ix, 25)
+        assert not em._sorted
+        assert len(em.get_subset_frame(0, 24)) == 25
+
+    def test_get_subset_frame_sorted_unsorted(self):
+        em = EmitterSet(torch.rand((6, 3)), torch.rand(6), torch.tensor([0, 0, 1, 1, 2, 3]))
+        em_sorted = em.sort_by_frame()
+        assert em_sorted._sorted and not em._sorted
+
+        for frame_start, frame_end in ((0.5, 2), (0, 1.5), (-1.5, 0.), (0.2, 0.8), (3, 10),
+                                     (0, float('inf')), (float('-inf'), 5)):
+            assert em.get_subset_frame(frame_start, frame_end) == em_sorted.get_subset_frame(frame_start, frame_end)
+
     def test_split_in_frames(self, em2d, em3d):
         splits = em2d.split_in_frames(None, None)
         assert splits.__len__() == 1
@@ -167,6 +339,20 @@ class TestEmitterSet:
         splits = neg_frames.split_in_frames(0, None)
         assert splits.__len__() == 2
 
+    @pytest.mark.parametrize("sort", [False, True])
+    def test_split_in_frames_independent(self, em3d, sort):
+        """Splits must not share storage with the original set, regardless of its order"""
+        em = em3d.sort_by_frame() if sort else em3d
+        em_ref = em.clone()
+
+        splits = em.split_in_frames(None, None)
+        for em_split in splits:
+            em_split.frame_ix += 1
+            em_split.xyz *= 2
+
+        assert em == em_ref
+        assert (EmitterSet.cat(splits).frame_ix == em_ref.sort_by_frame().frame_ix + 1).all()
+
     def test_adjacent_frame_split(self):
         xyz = torch.rand((500, 3))
         phot = torch.rand_like(xyz[:, 0])
@@ -295,11 +481,31 @@ class TestEmitterSet:
         else:
             assert not (em_a == em_b)
 
+    def test_eq_partial_nan(self):
+        em = EmitterSet(torch.rand(2, 3), torch.rand(2), torch.zeros(2).long(), bg=torch.tensor([float('nan'), 1.]),
+                        xy_unit='px')
+
+        assert em == em.clone()
+
+        em_other = em.clone()
+        em_other.bg = torch.tensor([float('nan'), 2.])
+        assert not (em == em_other)
+
 
 def test_empty_emitterset():
     em = EmptyEmitterSet()
     assert 0 == len(em)
 
+    """Must equal an empty set constructed the regular way"""
+    em_ref = EmitterSet(torch.zeros((0, 3)), torch.zeros(0), torch.zeros(0).long())
+    assert em == em_ref
+    assert em.xyz.size() == em_ref.xyz.size()
+    assert em.id.dtype == em_ref.id.dtype
+
+    em = EmptyEmitterSet(xy_unit='px', px_size=(100., 100.))
+    assert isinstance(em.px_size, torch.Tensor)
+    assert len(EmitterSet.cat([em, em_ref.clone()])) == 0
+
 
 class TestLooseEmitterSet:
 
@@ -1,4 +1,6 @@
+import hashlib
 import os
+import pathlib
 import time
 
 import pytest
@@ -11,6 +13,15 @@ deepsmlm_root = os.path.abspath(
                  os.pardir, os.pardir)) + '/'
 
 
+@pytest.mark.parametrize("n_bytes", [0, 1, 64 * 1024 + 3])
+def test_hash_model(tmpdir, n_bytes):
+    """Hash must be the sha1 of the complete file content, regardless of the file size."""
+    p = pathlib.Path(tmpdir) / 'model.pt'
+    p.write_bytes(os.urandom(n_bytes))
+
+    assert io_model.hash_model(p) == hashlib.sha1(p.read_bytes()).hexdigest()
+
+
 @pytest.fixture
 def unet():
     """Inits an arbitrary UNet."""
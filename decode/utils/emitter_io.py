@@ -53,10 +53,12 @@ def load_csv(file: (str, pathlib.Path), mapping: (None, dict) = None, **pd_csv_a
 
 def save_csv(file: (str, pathlib.Path), data: dict):
     def convert_dict_torch_numpy(data: dict) -> dict:
-        """Convert all torch tensors in dict to numpy."""
+        """Convert all torch tensors in dict to numpy (without copy for cpu tensors)."""
         for k, v in data.items():
             if isinstance(v, torch.Tensor):
-                data[k] = v.numpy()
+                v = v.detach().cpu()
+                # reduced precision storage (e.g. cramer-rao) is written with single precision
+                data[k] = (v.float() if v.dtype in (torch.half, torch.bfloat16) else v).numpy()
         return data
 
     def change_to_one_dim(data: dict) -> dict:
@@ -68,19 +70,22 @@ def save_csv(file: (str, pathlib.Path), data: dict):
 
         """
         xyz = data.pop('xyz')
-        xyz_cr = data.pop('xyz_cr')
-        xyz_sig = data.pop('xyz_sig')
+        xyz_cr = data.pop('xyz_cr', None)
+        xyz_sig = data.pop('xyz_sig', None)
 
         data_one_dim = {'x': xyz[:, 0], 'y': xyz[:, 1], 'z': xyz[:, 2]}
         data_one_dim.update(data)
-        data_one_dim.update({'x_cr': xyz_cr[:, 0], 'y_cr': xyz_cr[:, 1], 'z_cr': xyz_cr[:, 2]})
-        data_one_dim.update({'x_sig': xyz_sig[:, 0], 'y_sig': xyz_sig[:, 1], 'z_sig': xyz_sig[:, 2]})
+        if xyz_cr is not None:
+            data_one_dim.update({'x_cr': xyz_cr[:, 0], 'y_cr': xyz_cr[:, 1], 'z_cr': xyz_cr[:, 2]})
+        if xyz_sig is not None:
+            data_one_dim.update({'x_sig': xyz_sig[:, 0], 'y_sig': xyz_sig[:, 1], 'z_sig': xyz_sig[:, 2]})
 
         return data_one_dim
 
     """Change torch to numpy and convert 2D elements to 1D"""
-    data = copy.deepcopy(data)
-    data.pop('px_size')
+    # shallow copy suffices, the tensors themselves are not modified. Attributes may be missing (e.g. from load_csv)
+    data = dict(data)
+    data.pop('px_size', None)
     data = change_to_one_dim(convert_dict_torch_numpy(data))
 
     df = pd.DataFrame.from_dict(data)
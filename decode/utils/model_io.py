@@ -1,5 +1,7 @@
 import hashlib
 import math
+import mmap
+import os
 import pathlib
 import time
 from typing import Union
@@ -10,16 +12,14 @@ import torch
 def hash_model(modelfile):
     """
     Calculate hash and show it to the user.
-    (https://www.pythoncentral.io/hashing-files-with-python/)
+    The file is memory mapped and hashed in a single call instead of a Python loop over chunks.
     """
-    blocksize = 65536
-    hasher = hashlib.sha1()
     with open(modelfile, 'rb') as afile:
-        buf = afile.read(blocksize)
-        while len(buf) > 0:
-            hasher.update(buf)
-            buf = afile.read(blocksize)
-    return hasher.hexdigest()
+        if os.fstat(afile.fileno()).st_size == 0:  # empty files can not be memory mapped
+            return hashlib.sha1().hexdigest()
+
+        with mmap.mmap(afile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha1(mm).hexdigest()
 
 
 class LoadSaveModel: